@@ -32,26 +32,50 @@ CLI-параметры:
   --schema <path>      путь к файлу схемы (по умолчанию cfg/schema/cfg_validation_schema.yaml)`
 """
 
+import os
+import copy
 import yaml
-import argparse
 import logging
 from pathlib import Path
 from jsonschema import Draft7Validator, ValidationError
 from referencing import Registry, Resource
 from typing import Optional, Union
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # C-парсер libyaml
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+    logging.getLogger(__name__).warning(
+        "libyaml недоступен: YAML-конфиги разбираются медленным Python-парсером"
+    )
+
 LoggerType = Union[logging.Logger, logging.LoggerAdapter]
 
+# Кэш схем: нормализованный путь -> (mtime_ns, размер, схема)
+_schema_cache: dict[str, tuple[int, int, dict]] = {}
+
 
 def load_schema(schema_path: Path) -> dict:
     """
     Загружает JSON Schema из YAML-файла.
+    Повторные вызовы для того же пути берут схему из кэша.
+    Кэш сбрасывается, если у файла изменились mtime или размер.
+    Возвращается копия, чтобы изменения на стороне вызывающего не портили кэш.
 
     :param pathlib.Path `schema_path`: путь к файлу схемы
     :returns `dict`: JSON Schema как словарь
     """
-    with open(schema_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    key = os.path.normpath(os.fspath(schema_path))
+    st = os.stat(key)
+    cached = _schema_cache.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return copy.deepcopy(cached[2])
+
+    # libyaml сам декодирует байты, лишнее декодирование в Python не нужно
+    schema = yaml.load(Path(key).read_bytes(), Loader=_SafeLoader)
+    _schema_cache[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(schema))
+    return schema
 
 
 class ConfigLoader:
@@ -60,28 +84,40 @@ class ConfigLoader:
     """
 
     def __init__(self, logger: Optional[LoggerType] = None):
-        self._cache: dict[Path, dict] = {}  # Инициализация пустого кэша
+        # Кэш: нормализованный путь -> (mtime_ns, размер, конфиг)
+        self._cache: dict[str, tuple[int, int, dict]] = {}
         self.logger: LoggerType = (
             logger if logger is not None else logging.getLogger(__name__)
         )
 
-    def load_config(self, path: Path) -> dict:
+    def load_config(
+        self, path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> dict:
         """
         Загружает YAML-конфиг и кэширует результат.
+        Кэш сбрасывается, если у файла изменились mtime или размер.
+        Возвращается копия, чтобы изменения на стороне вызывающего не портили кэш.
 
         :param pathlib.Path `path`: путь к YAML-файлу
+        :param os.stat_result `stat_result`: уже полученный stat файла (например, из os.scandir).
+            Defaults to None (stat выполняется здесь).
         :returns `dict`: содержимое конфига
         :raises `yaml.YAMLError`: при ошибке разбора YAML
         :raises `FileNotFoundError`: если файл не существует
         """
-        if path in self._cache:
-            self.logger.info(f"Загружена сохраненная конфигурация: {path.stem}")
-            return self._cache[path]
-
+        # Ключ кэша строится без обращений к ФС (в отличие от Path.resolve())
+        key = os.path.normpath(os.fspath(path))
         try:
-            with open(path, "r", encoding="utf8") as f:
-                data = yaml.safe_load(f)
-            self._cache[path] = data
+            st = stat_result if stat_result is not None else os.stat(key)
+            cached = self._cache.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                self.logger.info(f"Загружена сохраненная конфигурация: {path.stem}")
+                return copy.deepcopy(cached[2])
+
+            with open(key, "rb") as f:
+                data = yaml.load(f, Loader=_SafeLoader)
+            # В кэш кладётся копия, а свежеразобранный конфиг отдаётся вызывающему
+            self._cache[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
             self.logger.info(f"Конфиг успешно загружен: {path}")
             return data
         except yaml.YAMLError as e1:
@@ -109,33 +145,70 @@ class ConfigValidator:
         self.resource = Resource.from_contents(schema)
         # Регистрируем схему в реестре с URI "cfg://base" для разрешения ссылок
         self.registry = Registry().with_resource("cfg://base", self.resource)
+        # Кэш валидаторов по имени конфига: схема компилируется один раз
+        self._validators: dict[str, Draft7Validator] = {}
+
+    def _get_validator(self, config_name: str) -> Draft7Validator:
+        """
+        Возвращает закэшированный валидатор для секции схемы, создавая его при первом обращении.
+
+        :param str `config_name`: ключ схемы
+        :returns `Draft7Validator`: валидатор для указанной секции
+        :raises `KeyError`: если нет схемы для указанного config_name
+        """
+        validator = self._validators.get(config_name)
+        if validator is None:
+            if config_name not in self.schema:
+                raise KeyError(f"Схема для '{config_name}' не найдена")
+
+            full_schema = {
+                "definitions": self.schema.get("definitions", {}),
+                **self.schema[config_name],
+            }
+            validator = Draft7Validator(schema=full_schema, registry=self.registry)
+            self._validators[config_name] = validator
+        return validator
+
+    def is_valid(self, config: dict, config_name: str) -> bool:
+        """
+        Быстрая проверка конфигурации без построения списка ошибок.
 
-    def validate(self, config: dict, config_name: str) -> None:
+        :param dict `config`: данные из YAML-файла
+        :param str `config_name`: ключ схемы (обычно stem от имени файла)
+        :returns `bool`: True если конфиг соответствует схеме
+        :raises `KeyError`: если нет схемы для указанного config_name
+        """
+        return self._get_validator(config_name).is_valid(config)
+
+    def validate(
+        self, config: dict, config_name: str, collect_all: bool = False
+    ) -> None:
         """
         Валидирует YAML-конфигурацию по схеме.
+        Ошибки собираются только если конфиг не прошёл быструю проверку.
 
         :param dict `config`: данные из YAML-файла
         :param str `config_name`: ключ схемы (обычно stem от имени файла)
+        :param bool `collect_all`: собрать все ошибки (True) или только первую. Defaults to False.
         :raises `ValidationError`: при ошибках валидации
         :raises `KeyError`: если нет схемы для указанного config_name
         """
-        if config_name not in self.schema:
-            raise KeyError(f"Схема для '{config_name}' не найдена")
+        validator = self._get_validator(config_name)
+        if validator.is_valid(config):
+            return
 
-        full_schema = {
-            "definitions": self.schema.get("definitions", {}),
-            **self.schema[config_name],
-        }
+        if not collect_all:
+            err = next(validator.iter_errors(config))
+            path_str = ".".join(map(str, err.path)) or "<root>"
+            raise ValidationError(f"{path_str}: {err.message}")
 
-        validator = Draft7Validator(schema=full_schema, registry=self.registry)
-        errors = sorted(validator.iter_errors(config), key=lambda e: list(e.path))
-
-        if errors:
-            msgs = []
-            for err in errors:
-                path_str = ".".join(map(str, err.path)) or "<root>"
-                msgs.append(f"{path_str}: {err.message}")
-            raise ValidationError("\n".join(msgs))
+        # Сортируются уже готовые строки, а не объекты ошибок по их путям
+        msgs = [
+            f"{'.'.join(map(str, err.path)) or '<root>'}: {err.message}"
+            for err in validator.iter_errors(config)
+        ]
+        msgs.sort()
+        raise ValidationError("\n".join(msgs))
 
 
 class ConfigChecker:
@@ -162,16 +235,20 @@ class ConfigChecker:
             logger if logger is not None else logging.getLogger(__name__)
         )
 
-    def validate_file(self, path: Path) -> bool:
+    def validate_file(
+        self, path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> bool:
         """
         Валидирует один файл и логирует результат.
 
         :param pathlib.Path `path`: путь к YAML-файлу
+        :param os.stat_result `stat_result`: уже полученный stat файла. Defaults to None.
         :returns `bool`: True если успешно, иначе False
         """
         try:
-            config = self.loader.load_config(path)
-            self.validator.validate(config, path.stem)
+            config = self.loader.load_config(path, stat_result)
+            # В лог попадают все ошибки файла, а не только первая
+            self.validator.validate(config, path.stem, collect_all=True)
             self.logger.info(f"[OK] {path} VALIDATED!")
             return True
         except (ValidationError, KeyError, yaml.YAMLError) as e:
@@ -184,11 +261,19 @@ class ConfigChecker:
 
         :returns `str`: результат валидации (успех или количество ошибок)
         """
-        files = list(self.cfg_dir.glob("*.yaml"))
+        # Один проход scandir: тип файла берётся из записи каталога,
+        # а stat передаётся дальше в кэш загрузчика без повторного вызова
+        with os.scandir(self.cfg_dir) as it:
+            entries = [
+                e
+                for e in it
+                if e.name.endswith(".yaml")
+                and not e.name.startswith(".")
+                and e.is_file()
+            ]
         failures = 0
-
-        for f in files:
-            if not self.validate_file(f):
+        for e in entries:
+            if not self.validate_file(Path(e.path), e.stat()):
                 failures += 1
 
         if failures:
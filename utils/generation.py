@@ -4,7 +4,7 @@
 Классы:
 -------
 1. DataGenerator:
-    Базовый класс генерации данных. Предоставляет методы загрязнения данных (_inject_anomaly)
+    Базовый класс генерации данных. Предоставляет методы загрязнения данных (_inject_anomalies)
     и утилиты для генерации названий продуктов, извлечения ID из БД и др.
 
 2. SQLiteGenerator(DataGenerator):
@@ -56,12 +56,35 @@ import sqlite3
 import random
 import logging
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from contextlib import closing
+from datetime import datetime
+from itertools import chain, repeat
+from typing import Any, Iterable, Iterator, Sequence, Union, Optional
 import faker
+import numpy as np
 
 LoggerType = Union[logging.Logger, logging.LoggerAdapter]
 
+# PRAGMA для массовой загрузки синтетической БД.
+# locking_mode идёт до journal_mode: тогда WAL работает без shm-файла
+SQLITE_PRAGMAS = {
+    "locking_mode": "EXCLUSIVE",  # БД заполняется одним соединением
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -200_000,  # Отрицательное значение - в KiB, т.е. ~200 MB
+}
+
+# Режим массовой загрузки (`bulk_load: true`): без гарантий сохранности при сбое.
+# page_size должен идти первым - он применяется только к ещё пустой БД
+SQLITE_BULK_LOAD_PRAGMAS = {
+    "page_size": 65_536,
+    **SQLITE_PRAGMAS,
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -1_048_576,  # ~1 GB
+}
+
 
 class DataGenerator:
     """
@@ -76,23 +99,40 @@ class DataGenerator:
         Конфигурация для генерации данных
     faker : Faker
         Объект Faker для генерации случайных данных
+    seed : int | None
+        Зерно генераторов случайных чисел для воспроизводимых запусков
+    random : random.Random
+        Экземпляр ГСЧ для выборок из списков значений
+    rng : numpy.random.Generator
+        Генератор случайных чисел для пакетной генерации числовых колонок
+    faker_pool_size : int
+        Размер пула значений Faker для больших таблиц (0 - без пула)
     anomaly_cfg : dict
         Конфигурация для внедрения аномалий в данные
 
     Методы:
     -------
-    _inject_anomaly(value: Any, dtype: str, nullable: bool = True) -> Any
-        Внедряет аномалии в данные с заданной вероятностью
+    _fake_column(provider: str, num_rows: int) -> list[str]
+        Генерирует колонку значений Faker, при необходимости из пула
+
+    _choice_column(values: Sequence[Any], num_rows: int) -> list[Any]
+        Выбирает колонку значений с возвращением одним вызовом NumPy
+
+    _inject_anomalies(values: list[Any], dtype: str, nullable: bool = True) -> list[Any]
+        Внедряет аномалии в колонку значений с заданной вероятностью
 
-    _get_product_names(num_rows: int, products: list, models: list, colors: list) -> set[str]
+    _get_product_names(num_rows: int, products: list, models: list, colors: list) -> list[str]
         Генерирует уникальные названия продуктов из комбинаций названий, моделей и цветов
 
-    _get_ids(cursor: sqlite3.Cursor) -> list[str]
+    _get_ids(cursor: sqlite3.Cursor) -> np.ndarray
         Извлекает ID пользователей из таблицы users
 
-    _get_product_ids(cursor: sqlite3.Cursor) -> list[str]
+    _get_product_ids(cursor: sqlite3.Cursor) -> np.ndarray
         Извлекает ID продуктов из таблицы products
 
+    _get_inserted_ids(cursor: sqlite3.Cursor, num_rows: int) -> np.ndarray
+        Восстанавливает ID последней пачки вставленных строк без SELECT по таблице
+
     Особенности:
     -----------
     - Поддерживает конфигурируемое внедрение аномалий в данные
@@ -103,48 +143,116 @@ class DataGenerator:
 
     def __init__(self, gen_config: dict, logger: Optional[LoggerType] = None):
         self.cfg = gen_config  # Конфигурация для генерации данных
-        self.faker = faker.Faker()  # Генератор случайных данных
+        # Зерно генерации (None - недетерминированный запуск)
+        self.seed = self.cfg.get("seed")
+        # Из одного зерна выводятся независимые дочерние зёрна, чтобы потоки
+        # Faker, random и numpy не были скоррелированы между собой
+        faker_seed, random_seed, rng_seed = np.random.SeedSequence(self.seed).spawn(3)
+        # Генератор случайных данных; без взвешивания выбор идёт простым random.choice
+        self.faker = faker.Faker("en_US", use_weighting=False)
+        self.faker.seed_instance(int(faker_seed.generate_state(1, np.uint64)[0]))
+        # Собственные экземпляры ГСЧ вместо глобального состояния модуля random
+        self.random = random.Random(int(random_seed.generate_state(1, np.uint64)[0]))
+        self.rng = np.random.default_rng(rng_seed)  # Пакетная генерация числовых колонок
         self.anomaly_cfg = self.cfg.get(
             "anomaly_cfg", {}
         )  # Конфигурация загрязнения данных
+        # Параметры загрязнения читаются из конфигурации один раз
+        self._anomaly_probability = self.anomaly_cfg.get("probability", 0.1)
+        self._anomaly_strategies = {
+            dtype: tuple(values)
+            for dtype, values in self.anomaly_cfg.get("strategies", {}).items()
+        }
         self.logger: LoggerType = logger or logging.getLogger(__name__)
+        # Размер пула значений Faker (0 - каждое значение генерируется отдельно)
+        self.faker_pool_size = self.cfg.get("faker_pool_size", 0)
+        self._faker_pools: dict[str, np.ndarray] = {}
+
+    def _fake_column(self, provider: str, num_rows: int) -> list[str]:
+        """
+        Генерация колонки значений провайдера Faker.
+        Если задан `faker_pool_size` и строк больше размера пула, значения выбираются
+        из заранее сгенерированного пула одним `_choice_column` вместо вызова Faker на строку.
+
+        :param str `provider`: Имя метода Faker (например, "name", "address").
+        :param int `num_rows`: Количество генерируемых значений.
+        :return `list[str]`: Список сгенерированных значений.
+        """
+        fake = getattr(self.faker, provider)
+        if not self.faker_pool_size or num_rows <= self.faker_pool_size:
+            return [fake() for _ in range(num_rows)]
+
+        pool = self._faker_pools.get(provider)
+        if pool is None:
+            pool = np.array([fake() for _ in range(self.faker_pool_size)], dtype=object)
+            self._faker_pools[provider] = pool
+        return self._choice_column(pool, num_rows)
+
+    def _choice_column(self, values: Sequence[Any], num_rows: int) -> list[Any]:
+        """
+        Выбор `num_rows` значений с возвращением.
+        Индексы генерируются одним вызовом `rng.integers`, значения берутся индексированием
+        массива NumPy вместо цикла `random.choices` на Python.
+
+        :param Sequence[Any] `values`: Допустимые значения; массив NumPy (например,
+            подготовленный с dtype=object или массив id) используется без копирования.
+        :param int `num_rows`: Количество выбираемых значений.
+        :raises `ValueError`: если список допустимых значений пуст
+        :return `list[Any]`: Список выбранных значений (исходные объекты Python).
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.asarray(values, dtype=object)
+        if not values.size:
+            raise ValueError("Невозможно выбрать значения из пустого списка")
+        return values[self.rng.integers(0, values.size, size=num_rows)].tolist()
 
-    def _inject_anomaly(
+    def _inject_anomalies(
         self,
-        value: Any,
+        values: list[Any],
         dtype: str,
         nullable: bool = True,
-    ):
+    ) -> list[Any]:
         """
-        Функция для `загрязнения` генерируемых данных.
+        Функция для `загрязнения` колонки генерируемых данных.
+        Загрязняемые позиции выбираются одной маской NumPy, замены - одним `random.choices`.
 
-        :param Any `value`: Оригинальное значение, которое вероятностно будет заменено на аномальное значение.
-        :param str `dtype`: Тип данных значения. Необходим для выбора аномалий.
+        :param list[Any] `values`: Оригинальные значения колонки.
+        :param str `dtype`: Тип данных значений. Необходим для выбора аномалий.
         :param bool `nullable`: Флаг, указывающий, может ли значение быть `None`. Defaults to True.
-        :return `Any`: Загрязненное значение или оригинальное, если не было загрязнения.
+        :return `list[Any]`: Колонка с загрязненными значениями.
         """
-        probability = self.anomaly_cfg.get("probability", 0.1)
-        if random.random() > probability:
-            return value
+        strategies = self._anomaly_strategies.get(dtype)
+        if not strategies and not nullable:
+            return values
 
-        strategies = self.anomaly_cfg.get("strategies", {}).get(dtype, [])
+        positions = np.flatnonzero(
+            self.rng.random(len(values)) <= self._anomaly_probability
+        )
+        if not positions.size:
+            return values
 
         if strategies:
-            return random.choice(strategies)
+            replacements = self.random.choices(strategies, k=positions.size)
+        else:
+            replacements = [None] * positions.size
 
-        return None if nullable else value
+        values = list(values)
+        for pos, replacement in zip(positions.tolist(), replacements):
+            values[pos] = replacement
+        return values
 
-    @staticmethod
     def _get_product_names(
+        self,
         num_rows: int,
         products: list,
         models: list,
         colors: list,
         logger: Optional[LoggerType] = None,
-    ) -> set[str]:
+    ) -> list[str]:
         """
         Генерация уникальных наименований товаров:
         случайные комбинации названий, модели и цвета.
+        Комбинации выбираются без повторений по индексу декартова произведения.
 
         :param int `num_rows`: Количество строк для генерации.
         :param list `products`: Список названий продуктов.
@@ -152,19 +260,31 @@ class DataGenerator:
         :param list `colors`: Список цветов.
         :param logger: логгер для сообщений (опционально)
         :raises `ValueError`: если в аргументы передан хотя бы один пустой список
-        :return `set`: Множество уникальных названий товаров.
+            или уникальных комбинаций меньше, чем `num_rows`
+        :return `list`: Список уникальных названий товаров.
         """
         logger = logger or logging.getLogger(__name__)
         if logger:
             logger.info("Генерация уникальных названий товаров...")
-        product_names = set()  # set для контроля уникальности названий
 
         if not all([products, models, colors]):
             raise ValueError("Списки products/models/colors не определены или пусты")
 
-        while len(product_names) < num_rows:
-            product_name = f"{random.choice(colors)} {random.choice(products)} {random.choice(models)}"
-            product_names.add(product_name)
+        num_products, num_models = len(products), len(models)
+        total = len(colors) * num_products * num_models
+        if num_rows > total:
+            raise ValueError(
+                f"Невозможно сгенерировать {num_rows} уникальных названий товаров: "
+                f"доступно только {total} комбинаций"
+            )
+
+        product_names = []
+        for idx in self.random.sample(range(total), k=num_rows):
+            color_idx, rest = divmod(idx, num_products * num_models)
+            product_idx, model_idx = divmod(rest, num_models)
+            product_names.append(
+                f"{colors[color_idx]} {products[product_idx]} {models[model_idx]}"
+            )
 
         if logger:
             logger.info(
@@ -173,28 +293,95 @@ class DataGenerator:
         return product_names
 
     @staticmethod
-    def _get_ids(cursor: sqlite3.Cursor) -> list[str]:
+    def _format_past_dates(
+        offsets: np.ndarray, unit: str = "D", with_time: bool = False
+    ) -> list[str]:
+        """
+        Векторное форматирование дат, отстоящих от текущего момента на `offsets`.
+        Вычитание и форматирование выполняются в NumPy без datetime/strftime на каждое значение.
+
+        :param np.ndarray `offsets`: Массив смещений в прошлое.
+        :param str `unit`: Единица смещения NumPy ("D" - дни, "s" - секунды). Defaults to "D".
+        :param bool `with_time`: Формат "%Y-%m-%d %H:%M:%S" вместо "%Y-%m-%d". Defaults to False.
+        :return `list[str]`: Список дат в строковом виде.
+        """
+        now = np.datetime64(datetime.now(), "s" if with_time else "D")
+        dates = np.datetime_as_string(now - offsets.astype(f"timedelta64[{unit}]"))
+        if with_time:
+            # ISO-формат NumPy использует разделитель "T"
+            return [d.replace("T", " ") for d in dates.tolist()]
+        return dates.tolist()
+
+    def _get_unique_user_timestamps(
+        self, num_rows: int, user_ids: Sequence[int], days: int = 365
+    ) -> tuple[list[str], list[str]]:
+        """
+        Генерация уникальных пар (user_id, timestamp) для таблиц с композитным PK.
+        Пары выбираются без повторений из пространства `user_ids × секунды периода`,
+        поэтому уникальность обеспечивается без повторных попыток.
+
+        :param int `num_rows`: Количество пар.
+        :param Sequence[int] `user_ids`: Список пользовательских id.
+        :param int `days`: Глубина периода в днях. Defaults to 365.
+        :raises `ValueError`: если уникальных пар меньше, чем `num_rows`
+        :return `tuple[list[str], list[str]]`: Списки user_id и timestamp одинаковой длины.
+        """
+        seconds = days * 86400
+        space = len(user_ids) * seconds
+        if num_rows > space:
+            raise ValueError(
+                f"Невозможно сгенерировать {num_rows} уникальных пар (user_id, timestamp): "
+                f"доступно только {space}"
+            )
+
+        sample = self.random.sample(range(space), k=num_rows)
+        keys = np.fromiter(sample, dtype=np.int64, count=num_rows)
+        uid_idx, offsets = np.divmod(keys, seconds)
+        uids = np.asarray(user_ids)[uid_idx].tolist()
+        timestamps = self._format_past_dates(offsets, "s", with_time=True)
+        return uids, timestamps
+
+    @staticmethod
+    def _get_ids(cursor: sqlite3.Cursor) -> np.ndarray:
         """
         Вспомогательная функция для извлечения id из таблицы users.
         Понадобится для осуществления constraints.
+        Строки курсора читаются потоком сразу в массив int64, без списка Python.
 
         :param sqlite3.Cursor `cursor`: объект курсора соединения с БД
+        :return `np.ndarray`: массив id пользователей
         """
         cursor.execute("SELECT id FROM users")
-        user_ids = [row[0] for row in cursor.fetchall()]
-        return user_ids
+        return np.fromiter((row[0] for row in cursor), dtype=np.int64)
 
     @staticmethod
-    def _get_product_ids(cursor: sqlite3.Cursor) -> list[str]:
+    def _get_product_ids(cursor: sqlite3.Cursor) -> np.ndarray:
         """
         Вспомогательная функция для извлечения id из таблицы products.
         Понадобится для осуществления constraints.
+        Строки курсора читаются потоком сразу в массив int64, без списка Python.
 
         :param sqlite3.Cursor `cursor`: объект курсора соединения с БД
+        :return `np.ndarray`: массив id товаров
         """
         cursor.execute("SELECT id FROM products")
-        product_ids = [row[0] for row in cursor.fetchall()]
-        return product_ids
+        return np.fromiter((row[0] for row in cursor), dtype=np.int64)
+
+    @staticmethod
+    def _get_inserted_ids(cursor: sqlite3.Cursor, num_rows: int) -> np.ndarray:
+        """
+        Вспомогательная функция для получения id только что вставленных строк.
+        Для таблиц с `INTEGER PRIMARY KEY AUTOINCREMENT`, заполненных одной пачкой
+        в рамках соединения, id идут подряд и заканчиваются на last_insert_rowid().
+        Используется только для таблиц, которые были пусты до вставки.
+
+        :param sqlite3.Cursor `cursor`: объект курсора соединения с БД
+        :param int `num_rows`: количество вставленных строк
+        :return `np.ndarray`: массив id вставленных строк
+        """
+        cursor.execute("SELECT last_insert_rowid()")
+        last_id = cursor.fetchone()[0]
+        return np.arange(last_id - num_rows + 1, last_id + 1, dtype=np.int64)
 
 
 class SQLiteGenerator(DataGenerator):
@@ -206,31 +393,34 @@ class SQLiteGenerator(DataGenerator):
 
     Основные методы:
     ---------------
-    _generate_users(num_rows: int) -> list[tuple[Any]]
+    _generate_users(num_rows: int) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы users с полями:
         id, name, age, phone, email, country, reg_date
 
-    _generate_products(num_rows: int) -> list[tuple[Any]]
+    _generate_products(num_rows: int) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы products с полями:
         id, name, category, price
 
-    _generate_logs(num_rows: int) -> list[tuple[Any]]
+    _generate_logs(num_rows: int) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы logs с полями:
         id, severity, message, timestamp
 
-    _generate_transactions(num_rows: int, user_ids: list[str]) -> list[tuple[Any]]
+    _generate_transactions(num_rows: int, user_ids: Sequence[int]) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы transactions с полями:
         user_id, amount, timestamp, description, status
 
-    _generate_user_actions(num_rows: int, user_ids: list[str]) -> list[tuple[Any]]
+    _generate_user_actions(num_rows: int, user_ids: Sequence[int]) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы user_actions с полями:
         user_id, action, timestamp
 
-    _generate_orders(num_rows: int, user_ids: list[str], product_ids: list[str]) -> list[tuple[Any]]
+    _generate_orders(num_rows: int, user_ids: Sequence[int], product_ids: Sequence[int]) -> Iterator[tuple[Any, ...]]
         Генерирует данные для таблицы orders с полями:
         id, user_id, product_id, date, status, amount
 
-    populate_table(table_name: str, data: list[tuple[Any]], cursor: sqlite3.Cursor) -> None
+    _get_create_table_query(table: dict) -> str
+        Формирует DDL-запрос CREATE TABLE по описанию таблицы
+
+    populate_table(table_name: str, data: Iterable[tuple[Any, ...]], cursor: sqlite3.Cursor, columns: Optional[list[str]] = None) -> int
         Заполняет указанную таблицу сгенерированными данными
 
     create_db(db_name: Any = "", db_path: Any = "") -> None
@@ -238,240 +428,294 @@ class SQLiteGenerator(DataGenerator):
 
     Особенности:
     -----------
-    - Поддерживает внедрение аномалий в данные через метод _inject_anomaly
+    - Поддерживает внедрение аномалий в данные через метод _inject_anomalies
     - Обеспечивает уникальность составных ключей
     - Поддерживает внешние ключи между таблицами
     - Конфигурируемая структура таблиц через yaml/json конфиг
     - Логирование всех этапов генерации
     """
 
+    # Родительские таблицы: аргумент генератора -> таблица, чьи id он получает
+    TABLE_DEPENDENCIES = {
+        "transactions": {"user_ids": "users"},
+        "user_actions": {"user_ids": "users"},
+        "orders": {"user_ids": "users", "product_ids": "products"},
+    }
+
     def __init__(self, gen_config: dict, logger: Optional[LoggerType] = None):
         super().__init__(gen_config["sqlite"], logger=logger)
-        self.word_lists = self.cfg.get("word_lists", {})
+        # Реестр генераторов по имени таблицы
+        self._generators = {
+            "users": self._generate_users,
+            "products": self._generate_products,
+            "logs": self._generate_logs,
+            "transactions": self._generate_transactions,
+            "user_actions": self._generate_user_actions,
+            "orders": self._generate_orders,
+        }
+        # Чтение id родительских таблиц из БД, если они не заполнялись в этом запуске
+        self._id_fetchers = {
+            "users": self._get_ids,
+            "products": self._get_product_ids,
+        }
+        # Списки слов приводятся к кортежам один раз (в т.ч. вложенные, как log_messages)
+        self.word_lists = {
+            name: (
+                {key: tuple(items) for key, items in words.items()}
+                if isinstance(words, dict)
+                else tuple(words)
+            )
+            for name, words in self.cfg.get("word_lists", {}).items()
+        }
+        # Плоские списки слов дополнительно хранятся как массивы NumPy для пакетной выборки
+        self._word_arrays = {
+            name: np.array(words, dtype=object)
+            for name, words in self.word_lists.items()
+            if not isinstance(words, dict)
+        }
         self.logger: LoggerType = logger or logging.getLogger(__name__)
 
-    def _generate_users(self, num_rows: int) -> list[tuple[Any]]:
+    def _generate_users(self, num_rows: int) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы users.
 
         :param int `num_rows`: Количество генерируемых записей.
-        :return `list[tuple[Any]]`: Список сгенерированных записей.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
 
         self.logger.info(f"Генерация данных для таблицы `users`...")
-        data = []
-
-        for _ in range(num_rows):
-            name = self._inject_anomaly(self.faker.name(), "TEXT")
-            age = self._inject_anomaly(random.randint(18, 90), "INTEGER")
-            phone = self._inject_anomaly(self.faker.phone_number(), "TEXT")
-            email = self._inject_anomaly(self.faker.email(), "TEXT")
-            country = self._inject_anomaly(self.faker.country(), "TEXT")
-            reg_date = self._inject_anomaly(
-                (datetime.now() - timedelta(days=random.randint(0, 3650))).strftime(
-                    "%Y-%m-%d"
-                ),
-                "DATE",
-            )
-            data.append((None, name, age, phone, email, country, reg_date))
+        inject = self._inject_anomalies
+        ages = self.rng.integers(18, 91, size=num_rows).tolist()
+        reg_dates = self._format_past_dates(self.rng.integers(0, 3651, size=num_rows))
+
+        # Данные генерируются по колонкам, строки собираются через zip
+        names = inject(self._fake_column("name", num_rows), "TEXT")
+        ages = inject(ages, "INTEGER")
+        phones = inject(self._fake_column("phone_number", num_rows), "TEXT")
+        emails = inject(self._fake_column("email", num_rows), "TEXT")
+        countries = inject(self._fake_column("country", num_rows), "TEXT")
+        reg_dates = inject(reg_dates, "DATE")
+        data = zip(
+            repeat(None, num_rows), names, ages, phones, emails, countries, reg_dates
+        )
 
         self.logger.info("Генерация данных для таблицы `users` завершена!")
         return data
 
-    def _generate_products(self, num_rows: int) -> list[tuple[Any]]:
+    def _generate_products(self, num_rows: int) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы products.
 
         :param int `num_rows`: Количество генерируемых записей.
-        :return `list[tuple[Any]]`: Список сгенерированных записей.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
 
         self.logger.info(f"Генерация данных для таблицы `products`...")
 
-        data = []
         product_names = self._get_product_names(
             num_rows,
-            products=self.word_lists.get("products", []),
-            models=self.word_lists.get("models", []),
-            colors=self.word_lists.get("colors", []),
+            products=self.word_lists.get("products", ()),
+            models=self.word_lists.get("models", ()),
+            colors=self.word_lists.get("colors", ()),
             logger=self.logger,
         )
-
-        for _ in range(num_rows):
-            name = self._inject_anomaly(
-                product_names.pop(),
-                "TEXT",
-            )
-            category = self._inject_anomaly(
-                random.choice(self.word_lists.get("categories")), "TEXT"
-            )
-            price = self._inject_anomaly(round(random.uniform(1, 2500), 2), "REAL")
-            data.append((None, name, category, price))
+        categories = self._choice_column(
+            self._word_arrays.get("categories", ()), num_rows
+        )
+        # Цены в копейках: целочисленная выборка вместо округления float
+        prices = (self.rng.integers(100, 250_001, size=num_rows) / 100).tolist()
+
+        inject = self._inject_anomalies
+        data = zip(
+            repeat(None, num_rows),
+            inject(product_names, "TEXT"),
+            inject(categories, "TEXT"),
+            inject(prices, "REAL"),
+        )
 
         self.logger.info("Генерация данных для таблицы `products` завершена!")
         return data
 
-    def _generate_logs(self, num_rows: int) -> list[tuple[Any]]:
+    def _generate_logs(self, num_rows: int) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы logs.
 
         :param int `num_rows`: Количество генерируемых записей.
-        :return `list[tuple[Any]]`: Список сгенерированных записей.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
         self.logger.info("Генерация данных для таблицы logs...")
 
-        data = []
-        severities = list(self.word_lists["log_messages"].keys())
+        inject = self._inject_anomalies
         log_messages = self.word_lists["log_messages"]
+        severities = self._choice_column(tuple(log_messages), num_rows)
+        timestamps = self._format_past_dates(
+            self.rng.integers(0, 366, size=num_rows), with_time=True
+        )
 
-        for _ in range(num_rows):
-            severity = random.choice(severities)
-            message = self._inject_anomaly(
-                random.choice(log_messages.get(severity, ["default error"])),
-                "TEXT",
-            )
-            timestamp = self._inject_anomaly(
-                (datetime.now() - timedelta(days=random.randint(0, 365))).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-                "DATE",
-            )
-            severity = self._inject_anomaly(severity, "TEXT")
-            data.append((None, severity, message, timestamp))
+        # Сообщение выбирается по исходной (незагрязнённой) severity
+        default_messages = ("default error",)
+        choice = self.random.choice
+        messages = inject(
+            [choice(log_messages.get(s, default_messages)) for s in severities],
+            "TEXT",
+        )
+        timestamps = inject(timestamps, "DATE")
+        data = zip(
+            repeat(None, num_rows),
+            inject(severities, "TEXT"),
+            messages,
+            timestamps,
+        )
 
         self.logger.info("Генерация данных для таблицы `logs` завершена!")
         return data
 
     def _generate_transactions(
-        self, num_rows: int, user_ids: list[str]
-    ) -> list[tuple[Any]]:
+        self, num_rows: int, user_ids: Sequence[int]
+    ) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы transactions.
 
         :param  int `num_rows`: Количество генерируемых записей.
-        :param list[str] `user_ids`: Список пользовательских id.
-        :return `list[tuple[Any]]`: Список сгенерированных записей.
+        :param Sequence[int] `user_ids`: Список пользовательских id.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
 
         self.logger.info("Генерация данных для таблицы `transactions`...")
 
-        data = []
-        unique = set()  # Для контроля уникальности композитных PK
-        statuses = self.word_lists.get("status", {})
-        transaction_desc = self.word_lists.get("transaction_desc", {})
-
-        for _ in range(num_rows):
-            while True:
-                uid = random.choice(user_ids)
-                ts = (datetime.now() - timedelta(days=random.randint(0, 365))).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-                if (uid, ts) not in unique:
-                    unique.add((uid, ts))
-                    break
-            amount = self._inject_anomaly(
-                round(random.uniform(10.0, 1000.0), 2), "REAL"
-            )
-            description = self._inject_anomaly(
-                random.choice(transaction_desc),
-                "TEXT",
-            )
-            status = self._inject_anomaly(
-                random.choice(statuses),
-                "TEXT",
-            )
-
-            data.append((uid, amount, ts, description, status))
+        inject = self._inject_anomalies
+        choice_column = self._choice_column
+        statuses = self._word_arrays.get("status", ())
+        transaction_desc = self._word_arrays.get("transaction_desc", ())
+        # Уникальность композитных PK обеспечивается выборкой без повторений
+        uids, timestamps = self._get_unique_user_timestamps(num_rows, user_ids)
+        amounts = (self.rng.integers(1_000, 100_001, size=num_rows) / 100).tolist()
+
+        data = zip(
+            uids,
+            inject(amounts, "REAL"),
+            timestamps,
+            inject(choice_column(transaction_desc, num_rows), "TEXT"),
+            inject(choice_column(statuses, num_rows), "TEXT"),
+        )
 
         self.logger.info("Генерация данных для таблицы `transactions` завершена!")
         return data
 
     def _generate_user_actions(
-        self, num_rows: int, user_ids: list[str]
-    ) -> list[tuple[Any]]:
+        self, num_rows: int, user_ids: Sequence[int]
+    ) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы user_actions.
 
         :param int `num_rows`: Количество генерируемых записей.
-        :param list[str] user_ids: Список пользовательских id.
-        :return `list[tuple[Any]]`: Список сгенерированных записей.
+        :param Sequence[int] user_ids: Список пользовательских id.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
         self.logger.info("Генерация данных для таблицы `user_actions`")
 
-        data = []
-        unique = set()  # Для контроля уникальности композитных PK
-        actions = self.word_lists.get("actions", {})
+        inject = self._inject_anomalies
+        actions = self._word_arrays.get("actions", ())
+        # Уникальность композитных PK обеспечивается выборкой без повторений
+        uids, timestamps = self._get_unique_user_timestamps(num_rows, user_ids)
 
-        for _ in range(num_rows):
-            while True:
-                uid = random.choice(user_ids)
-                ts = (datetime.now() - timedelta(days=random.randint(0, 365))).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
-                if (uid, ts) not in unique:
-                    unique.add((uid, ts))
-                    break
-            action = self._inject_anomaly(random.choice(actions), "TEXT")
-            data.append((uid, action, ts))
+        data = zip(
+            uids,
+            inject(self._choice_column(actions, num_rows), "TEXT"),
+            timestamps,
+        )
 
         self.logger.info("Генерация данных для таблицы `user_actions` завершена!")
         return data
 
     def _generate_orders(
-        self, num_rows: int, user_ids: list[str], product_ids: list[str]
-    ) -> list[tuple[Any]]:
+        self, num_rows: int, user_ids: Sequence[int], product_ids: Sequence[int]
+    ) -> Iterator[tuple[Any, ...]]:
         """
         Генерация `грязных` данных для таблицы orders.
 
         :param int `num_rows`: Количество генерируемых записей.
-        :param list[str] `user_ids`: Список пользовательских id.
-        :param list[str] `product_ids`: Список id товаров.
-        :return `list[tuple[Any]]`: Список сгенерированных данных.
+        :param Sequence[int] `user_ids`: Список пользовательских id.
+        :param Sequence[int] `product_ids`: Список id товаров.
+        :return `Iterator[tuple[Any, ...]]`: Итератор сгенерированных записей.
         """
         self.logger.info("Генерация данных для таблицы `orders`...")
 
-        data = []
-        order_stats = self.word_lists.get("order_status", {})
-
-        for _ in range(num_rows):
-            uid = random.choice(user_ids)
-            pid = random.choice(product_ids)
-            date = self._inject_anomaly(
-                (datetime.now() - timedelta(days=random.randint(0, 365))).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-                "DATE",
-            )
-            status = self._inject_anomaly(
-                random.choice(order_stats),
-                "TEXT",
-            )
-            amount = self._inject_anomaly(random.randint(1, 2500), "REAL")
-            delivery_address = self._inject_anomaly(self.faker.address(), "TEXT")
-            data.append((None, uid, pid, date, status, amount, delivery_address))
+        inject = self._inject_anomalies
+        choice_column = self._choice_column
+        order_stats = self._word_arrays.get("order_status", ())
+        dates = self._format_past_dates(
+            self.rng.integers(0, 366, size=num_rows), with_time=True
+        )
+        amounts = self.rng.integers(1, 2501, size=num_rows).tolist()
+
+        data = zip(
+            repeat(None, num_rows),
+            choice_column(user_ids, num_rows),
+            choice_column(product_ids, num_rows),
+            inject(dates, "DATE"),
+            inject(choice_column(order_stats, num_rows), "TEXT"),
+            inject(amounts, "REAL"),
+            inject(self._fake_column("address", num_rows), "TEXT"),
+        )
 
         self.logger.info("Генерация данных для таблицы `orders` завершена!")
         return data
 
+    @staticmethod
+    def _get_create_table_query(table: dict) -> str:
+        """
+        Формирует DDL-запрос CREATE TABLE по описанию таблицы из конфигурации.
+
+        :param dict `table`: Описание таблицы (name, columns, constraints, without_rowid).
+        :return `str`: Запрос CREATE TABLE IF NOT EXISTS.
+        """
+        definitions = [
+            f"{col['name']} {col['type']} {col.get('options', '')}".rstrip()
+            for col in table["columns"]
+        ]
+        definitions.extend(table.get("constraints", []))
+        query = f"CREATE TABLE IF NOT EXISTS {table['name']} ({', '.join(definitions)})"
+        # Таблица хранится прямо в B-дереве первичного ключа, без отдельного индекса PK
+        if table.get("without_rowid"):
+            query += " WITHOUT ROWID"
+        return query
+
     def populate_table(
-        self, table_name: str, data: list[tuple[Any]], cursor: sqlite3.Cursor
-    ) -> None:
+        self,
+        table_name: str,
+        data: Iterable[tuple[Any, ...]],
+        cursor: sqlite3.Cursor,
+        columns: Optional[list[str]] = None,
+    ) -> int:
         """
         Метод для заполнения таблицы данными.
+        Строки потребляются из итератора напрямую, без промежуточного списка.
 
         :param str `table_name`: Имя таблицы.
-        :param list[tuple[Any]] `data`: Список сгенерированных данных.
+        :param Iterable[tuple[Any, ...]] `data`: Сгенерированные записи.
         :param sqlite3.Cursor `cursor`: Курсор для выполнения запросов к БД.
+        :param list[str] `columns`: Колонки в порядке значений записи. Если не заданы,
+            вставка идёт по всем колонкам таблицы в порядке DDL. Defaults to None.
+        :return `int`: Количество вставленных строк.
         """
 
         self.logger.info(f"Заполнение таблицы {table_name}...")
 
-        for row in data:
-            placeholders = ", ".join(["?" for _ in row])
-            query = f"INSERT INTO {table_name} VALUES ({placeholders})"
-            cursor.execute(query, row)
+        rows = iter(data)
+        first_row = next(rows, None)
+        if first_row is None:
+            self.logger.warning(f"Нет данных для заполнения таблицы {table_name}")
+            return 0
+
+        # Запрос собирается один раз на таблицу, вставка - одним executemany
+        placeholders = ", ".join("?" * len(columns or first_row))
+        column_list = f" ({', '.join(columns)})" if columns else ""
+        query = f"INSERT INTO {table_name}{column_list} VALUES ({placeholders})"
+        cursor.executemany(query, chain((first_row,), rows))
 
         self.logger.info(f"Таблица {table_name} успешно заполнена!")
+        return cursor.rowcount
 
     def create_db(self, db_name: Any = None, db_path: Any = None) -> None:
         """
@@ -501,78 +745,105 @@ class SQLiteGenerator(DataGenerator):
             self.logger.info(f"Создана директория {db_path}")
 
         full_path = db_path / db_name
-
-        with sqlite3.connect(full_path) as conn:
+        tables = self.cfg["tables"]
+        # DDL всех таблиц собирается заранее и выполняется одним executescript
+        ddl_script = ";\n".join(map(self._get_create_table_query, tables)) + ";"
+
+        # closing() закрывает соединение (и снимает эксклюзивную блокировку) даже при
+        # ошибке; вложенный `conn` лишь фиксирует или откатывает транзакцию
+        with closing(
+            sqlite3.connect(full_path, cached_statements=1024)
+        ) as conn, conn:
             self.logger.info(
                 f"Создана БД SQLite `{db_name}`. Приступаю к созданию таблиц."
             )
 
             cursor = conn.cursor()
-            table_names = []
-            count = 0
-
-            for table in self.cfg["tables"]:
+            pragmas = (
+                SQLITE_BULK_LOAD_PRAGMAS if self.cfg.get("bulk_load") else SQLITE_PRAGMAS
+            )
+            for pragma, value in pragmas.items():
+                cursor.execute(f"PRAGMA {pragma} = {value}")
+            table_names = [table["name"] for table in tables]
+
+            self.logger.info(f"Создаю таблицы: {', '.join(table_names)}...")
+            try:
+                cursor.executescript(ddl_script)
+            except sqlite3.Error as e:
+                self.logger.error(f"Ошибка при создании таблиц: {e}")
+                raise
+            self.logger.info("Таблицы успешно созданы!")
+
+            # id вставленных строк родительских таблиц для внешних ключей
+            inserted_ids: dict[str, np.ndarray] = {}
+            # Индексы создаются после заполнения всех таблиц
+            pending_indexes: list[tuple[str, list[str]]] = []
+
+            for table in tables:
                 table_name = table["name"]
-                columns = table["columns"]
-                constraints = table.get("constraints", [])
-                num_rows = table.get("num_rows", 1000)
+                num_rows = table.get("rows", 1000)
 
-                table_names.append(table_name)
+                pending_indexes.extend(
+                    (table_name, index_columns)
+                    for index_columns in table.get("indexes", [])
+                )
 
                 try:
-                    self.logger.info(f"Создаю таблицу {table_name}...")
-
-                    columns_str = ", ".join(
-                        [
-                            f"{col['name']} {col['type']} {col.get('options', '')}"
-                            for col in columns
-                        ]
+                    self.logger.info(
+                        f"Приступаю к заполненю таблицы {table_name} данными!"
                     )
-                    constraints_str = ", ".join(constraints)
 
-                    query = f"""
-                    CREATE TABLE IF NOT EXISTS {table_name} (
-                        {columns_str}
-                        {',' + constraints_str if constraints_str else ''}
-                    )
-                    """
-                    cursor.execute(query)
-
-                    self.logger.info(f"Таблица {table_name} успешно создана!")
-                    count += 1
-                    self.logger.info("Приступаю к заполненю таблицы данными!")
-
-                    method_name = getattr(self, f"_generate_{table_name}", None)
-                    if callable(method_name):
-                        if table_name in ["transactions", "user_actions"]:
-                            user_ids = self._get_ids(cursor=cursor)
-                            data = method_name(num_rows=num_rows, user_ids=user_ids)
-                        elif table_name in ["orders"]:
-                            user_ids = self._get_ids(cursor=cursor)
-                            product_ids = self._get_product_ids(cursor=cursor)
-                            data = method_name(
-                                num_rows=num_rows,
-                                user_ids=user_ids,
-                                product_ids=product_ids,
-                            )
-                        else:
-                            data = method_name(num_rows)
-
-                        if not isinstance(data, list) or not all(
-                            isinstance(row, tuple) for row in data
-                        ):
-                            raise TypeError(
-                                f"_generate_{table_name} должен возвращать list[tuple[Any]], а не {type(data)}"
+                    generate = self._generators.get(table_name)
+                    if generate is not None:
+                        # id родителей читаются из БД не более одного раза за запуск
+                        parent_ids = {}
+                        dependencies = self.TABLE_DEPENDENCIES.get(table_name, {})
+                        for arg_name, parent in dependencies.items():
+                            if parent not in inserted_ids:
+                                inserted_ids[parent] = self._id_fetchers[parent](
+                                    cursor=cursor
+                                )
+                            parent_ids[arg_name] = inserted_ids[parent]
+
+                        # id новых строк можно вычислить только для пустой таблицы:
+                        # при повторном запуске по существующей БД дочерние таблицы
+                        # должны ссылаться на все строки родителя, а не только на новые
+                        was_empty = (
+                            table_name in self._id_fetchers
+                            and cursor.execute(
+                                f"SELECT 1 FROM {table_name} LIMIT 1"
+                            ).fetchone()
+                            is None
+                        )
+
+                        data = generate(num_rows, **parent_ids)
+                        columns = [column["name"] for column in table["columns"]]
+                        inserted = self.populate_table(
+                            table_name, data, cursor, columns=columns
+                        )
+
+                        if was_empty and inserted:
+                            inserted_ids[table_name] = self._get_inserted_ids(
+                                cursor, inserted
                             )
 
-                        self.populate_table(table_name, data, cursor)
+                except sqlite3.Error as e:
+                    self.logger.error(f"Ошибка при заполнении таблицы {table_name}: {e}")
 
+            for table_name, index_columns in pending_indexes:
+                index_name = f"idx_{table_name}_{'_'.join(index_columns)}"
+                try:
+                    cursor.execute(
+                        f"CREATE INDEX IF NOT EXISTS {index_name} "
+                        f"ON {table_name} ({', '.join(index_columns)})"
+                    )
+                    self.logger.info(f"Создан индекс {index_name}")
                 except sqlite3.Error as e:
-                    self.logger.error(f"Ошибка при создании таблицы {table_name}: {e}")
+                    self.logger.error(f"Ошибка при создании индекса {index_name}: {e}")
 
             self.logger.info(
                 f"База данных `{db_name}` успешно создана: {full_path}.\n"
-                f"Сформировано {count} таблиц: {', '.join(table_names)}.\n"
+                f"Сформировано {len(table_names)} таблиц: {', '.join(table_names)}.\n"
                 f"Все таблицы успешно заполнены данными."
             )
 
@@ -5,6 +5,11 @@ from typing import Union, Optional
 
 LoggerType = Union[logging.Logger, logging.LoggerAdapter]
 
+# Управляющие символы ASCII, удаляемые перед профилированием
+_CONTROL_CHARS_RE = re.compile(r"[\x00-\x1F]+")
+# Результаты pd.api.types.infer_dtype для колонок, которые могут содержать строки
+_STRING_INFERRED = frozenset({"string", "mixed", "mixed-integer"})
+
 
 class DataProfiler:
     """
@@ -33,12 +38,17 @@ class DataProfiler:
             pd.DataFrame: Очищенный DataFrame
         """
 
-        def clean_value(x):
-            if isinstance(x, str):
-                return re.sub(r"[\x00-\x1F]+", "", x)
-            return x
-
-        return df.apply(lambda col: col.map(clean_value))
+        cleaned = df.copy(deep=False)
+        # Замена выполняется по колонке целиком; нестроковые значения в колонках
+        # смешанного типа str.replace превращает в NaN, поэтому они возвращаются как есть
+        for col in df.select_dtypes(include=["object", "string"]).columns:
+            values = df[col]
+            # Аксессор .str доступен только колонкам, где есть строки
+            if pd.api.types.infer_dtype(values, skipna=True) not in _STRING_INFERRED:
+                continue
+            replaced = values.str.replace(_CONTROL_CHARS_RE, "", regex=True)
+            cleaned[col] = replaced.where(replaced.notna(), values)
+        return cleaned
 
     def profile(self, df: pd.DataFrame) -> dict:
         """
@@ -57,15 +67,25 @@ class DataProfiler:
         profile_report = {}
 
         # Типы данных
-        profile_report["dtypes"] = df.dtypes.apply(lambda x: str(x)).to_dict()
+        profile_report["dtypes"] = {
+            col: str(dtype) for col, dtype in zip(df.columns, df.dtypes)
+        }
+
+        # Колонки разбиваются по типам один раз и переиспользуются ниже
+        numeric_df = df.select_dtypes(include=["number"])
+        categorical_df = df.select_dtypes(include=["object", "str", "category"])
 
-        # Статистика для числовых колонок
-        profile_report["numeric_summary"] = df.describe().to_dict()
+        # Статистика для числовых колонок; без них describe() по всей таблице,
+        # как и раньше, возвращает сводку по остальным колонкам
+        summary_df = numeric_df if numeric_df.shape[1] else df
+        profile_report["numeric_summary"] = (
+            summary_df.describe().to_dict() if summary_df.shape[1] else {}
+        )
 
         # Статистика для категориальных колонок
-        profile_report["categorical_summary"] = df.describe(
-            include=["object", "category"]
-        ).to_dict()
+        profile_report["categorical_summary"] = (
+            categorical_df.describe().to_dict() if categorical_df.shape[1] else {}
+        )
 
         # Кол-во пропусков
         profile_report["missing_values"] = df.isna().sum().to_dict()
@@ -74,8 +94,8 @@ class DataProfiler:
         profile_report["unique_values"] = df.nunique().to_dict()
 
         # Корреляция (числовые только)
-        if df.select_dtypes(include=["number"]).shape[1] > 1:
-            profile_report["correlation"] = df.corr().to_dict()
+        if numeric_df.shape[1] > 1:
+            profile_report["correlation"] = numeric_df.corr().to_dict()
         else:
             profile_report["correlation"] = {}
 
@@ -1,11 +1,15 @@
-import ast
 import logging
 import re
+import numpy as np
 import pandas as pd
+from types import CodeType
 from typing import Union, Optional
 
 LoggerType = Union[logging.Logger, logging.LoggerAdapter]
 
+# Глобальное пространство имён для вычисления условий: без встроенных функций
+_SAFE_GLOBALS = {"__builtins__": {}, "pd": pd, "re": re}
+
 
 class DataValidator:
     """
@@ -24,10 +28,35 @@ class DataValidator:
         self.const_cfg = val_cfg.get("constraints", {})
         self.ck_cfg = val_cfg.get("composite_keys", {})
         self.logger: LoggerType = logger or logging.getLogger(__name__)
+        # Скомпилированные условия фильтрации: строка условия -> объект кода
+        self._compiled_conditions: dict[str, CodeType] = {}
 
-    def _filter_df(self, df: pd.DataFrame, condition: str) -> pd.DataFrame:
+    def _compile_condition(self, condition: str) -> CodeType:
         """
-        Применяет безопасный фильтр к DataFrame на основе строкового выражения условия.
+        Переводит логические операторы условия в побитовые и компилирует выражение.
+        Результат кэшируется, поэтому каждое правило разбирается один раз за время жизни валидатора.
+
+        :param str `condition`: Условие фильтрации в строковом виде
+        :return `CodeType`: Скомпилированное выражение для `eval`
+        :raise `SyntaxError`: если условие не является корректным выражением Python
+        """
+        code = self._compiled_conditions.get(condition)
+        if code is None:
+            # Перевод логических операторов
+            safe_condition = (
+                condition.replace(" and ", " & ")
+                .replace(" or ", " | ")
+                .replace(" not ", " ~")
+            )
+            code = compile(safe_condition, "<constraint>", "eval")
+            self._compiled_conditions[condition] = code
+        return code
+
+    def _condition_mask(
+        self, df: pd.DataFrame, condition: str
+    ) -> Optional[np.ndarray]:
+        """
+        Вычисляет булеву маску строк DataFrame, удовлетворяющих строковому условию.
 
         Поддерживаемые выражения:
             - <column>.str.contains(<pattern>[, na=True|False])
@@ -35,36 +64,40 @@ class DataValidator:
             - <column>.isin([...])
             - Логические выражения, совместимые с pandas (and/or/not заменены на &,|,~)
 
-        В случае ошибки — возвращает оригинальный DataFrame и логирует предупреждение.
+        В случае ошибки — возвращает None и логирует предупреждение.
 
         :param pd.DataFrame `df`: Входной DataFrame
         :param str `condition`: Условие фильтрации в строковом виде
 
-        :return `pd.DataFrame`: Отфильтрованный DataFrame
-        :raise `Exception`: при внутренней ошибке обработки выражения
+        :return `np.ndarray | None`: Маска строк или None, если условие не удалось применить
         """
-        self.logger.debug(f"Применяется фильтр: {condition!r}")
-
-        safe_globals = {"__builtins__": {}, "pd": pd, "re": re}
-
-        # Перевод логических операторов
-        safe_condition = (
-            condition.replace(" and ", " & ")
-            .replace(" or ", " | ")
-            .replace(" not ", " ~")
-        )
+        self.logger.debug("Применяется фильтр: %r", condition)
 
         try:
-            result = eval(
-                safe_condition, safe_globals, {**{col: df[col] for col in df.columns}}
-            )
+            # DataFrame служит пространством имён напрямую: имя колонки -> df[имя]
+            result = eval(self._compile_condition(condition), _SAFE_GLOBALS, df)
             if isinstance(result, pd.Series) and result.dtype == bool:
-                return df[result]
+                return result.to_numpy()
             else:
                 raise ValueError("Результат выражения не является булевой маской")
         except Exception as e:
-            self.logger.warning(f"Ошибка применения фильтра '{condition}': {e}")
-            return df
+            self.logger.warning("Ошибка применения фильтра '%s': %s", condition, e)
+            return None
+
+    def _filter_df(self, df: pd.DataFrame, condition: str) -> pd.DataFrame:
+        """
+        Применяет безопасный фильтр к DataFrame на основе строкового выражения условия.
+        Поддерживаемые выражения описаны в `_condition_mask`.
+
+        В случае ошибки — возвращает оригинальный DataFrame и логирует предупреждение.
+
+        :param pd.DataFrame `df`: Входной DataFrame
+        :param str `condition`: Условие фильтрации в строковом виде
+
+        :return `pd.DataFrame`: Отфильтрованный DataFrame
+        """
+        mask = self._condition_mask(df, condition)
+        return df if mask is None else df[mask]
 
     def validate_foreign_keys(
         self, df_dict: dict[str, pd.DataFrame]
@@ -77,23 +110,52 @@ class DataValidator:
         """
         self.logger.info("Валидация внешних ключей...")
 
+        # Индексы значений родительских колонок переиспользуются между дочерними таблицами
+        parent_indexes: dict[tuple[str, str], pd.Index] = {}
+        # Счётчики удалённых строк нужны только для INFO-логов
+        log_drops = self.logger.isEnabledFor(logging.INFO)
+
         for table, fks in self.fk_cfg.items():
+            child_df = df_dict.get(table)
+            # Маски всех FK таблицы объединяются, срез выполняется один раз
+            keep = None if child_df is None else np.ones(len(child_df), dtype=bool)
+            checked = False
             for fk_col, parent_key in fks.items():
                 parent_table, parent_col = parent_key.split(".")
                 if table not in df_dict or parent_table not in df_dict:
                     self.logger.warning(
-                        f"Пропущена FK-проверка {table}.{fk_col} -> {parent_table}.{parent_col}"
+                        "Пропущена FK-проверка %s.%s -> %s.%s",
+                        table,
+                        fk_col,
+                        parent_table,
+                        parent_col,
                     )
                     continue
 
-                child_df = df_dict[table]
-                parent_ids = set(df_dict[parent_table][parent_col])
-                before = len(child_df)
-                child_df = child_df[child_df[fk_col].isin(parent_ids)]
-                after = len(child_df)
-                self.logger.info(
-                    f"{table}: удалено {before - after} строк по внешнему ключу '{fk_col}'"
-                )
+                parent_ids = parent_indexes.get((parent_table, parent_col))
+                if parent_ids is None:
+                    parent_ids = pd.Index(df_dict[parent_table][parent_col]).unique()
+                    parent_indexes[(parent_table, parent_col)] = parent_ids
+                fk_mask = child_df[fk_col].isin(parent_ids).to_numpy()
+                if log_drops:
+                    # Считаются только строки, не отброшенные предыдущими FK
+                    dropped = np.count_nonzero(keep & ~fk_mask)
+                    self.logger.info(
+                        "%s: удалено %d строк по внешнему ключу '%s'",
+                        table,
+                        dropped,
+                        fk_col,
+                    )
+                keep &= fk_mask
+                checked = True
+
+            # Индекс сбрасывается один раз на таблицу после всех её FK-проверок
+            if checked:
+                if not keep.all():
+                    child_df = child_df[keep]
+                    # Таблица изменилась - её индексы как родителя больше не актуальны
+                    for key in [key for key in parent_indexes if key[0] == table]:
+                        del parent_indexes[key]
                 df_dict[table] = child_df.reset_index(drop=True)
 
         self.logger.info("Валидация внешних ключей завершена.")
@@ -108,14 +170,26 @@ class DataValidator:
         :param dict[str, pd.DataFrame] `df_dict`: Таблицы для валидации
         :return `dict[str, pd.DataFrame]`: Таблицы после применения ограничений
         """
+        # Счётчики удалённых строк нужны только для INFO-логов
+        log_drops = self.logger.isEnabledFor(logging.INFO)
         for table, df in df_dict.items():
             rules = self.const_cfg.get(table, [])
+            # Маски правил вычисляются по исходной таблице и объединяются,
+            # срез выполняется один раз после всех правил
+            keep = np.ones(len(df), dtype=bool)
             for cond in rules:
-                before = len(df)
-                df = self._filter_df(df, cond)
-                self.logger.info(
-                    f"{table}: удалено {before - len(df)} строк по правилу '{cond}'"
-                )
+                mask = self._condition_mask(df, cond)
+                if log_drops:
+                    # Считаются только строки, не отброшенные предыдущими правилами
+                    dropped = 0 if mask is None else np.count_nonzero(keep & ~mask)
+                    self.logger.info(
+                        "%s: удалено %d строк по правилу '%s'", table, dropped, cond
+                    )
+                if mask is not None:
+                    keep &= mask
+            if not keep.all():
+                df = df[keep]
+            # Индекс сбрасывается один раз на таблицу, даже если строки не удалялись
             df_dict[table] = df.reset_index(drop=True)
         return df_dict
 
@@ -136,7 +210,7 @@ class DataValidator:
             for keys in keys_list:
                 if df.duplicated(subset=keys).any():
                     self.logger.warning(
-                        f"{table}: дублирующиеся записи по ключу {keys}"
+                        "%s: дублирующиеся записи по ключу %s", table, keys
                     )
         self.logger.info("Валидация составных ключей завершена.")
         return df_dict
@@ -162,5 +236,5 @@ class DataValidator:
             self.logger.info("Полная валидация завершена.")
             return df_dict
         except Exception as e:
-            self.logger.error(f"Ошибка валидации: {e}")
+            self.logger.error("Ошибка валидации: %s", e)
             raise